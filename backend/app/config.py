@@ -3,44 +3,55 @@ Application configuration using pydantic-settings.
 Loads environment variables from .env file.
 """
 
-from pydantic_settings import BaseSettings
-from functools import lru_cache
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import cache, cached_property
+
+
+# Common development origins, always allowed
+_DEFAULT_ORIGINS = ("http://localhost:3000", "http://localhost:3001")
 
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+    
     # Supabase (optional - will use mock mode if not set)
     supabase_url: str = ""
-    supabase_key: str = ""
+    supabase_key: str = Field(default="", repr=False)
     
     # OpenRouter API Key (single key for all LLMs)
-    openrouter_api_key: str = ""
+    openrouter_api_key: str = Field(default="", repr=False)
     
-    # Legacy individual API Keys (optional fallback)
-    openai_api_key: str = ""
-    anthropic_api_key: str = ""
-    google_api_key: str = ""
-    deepseek_api_key: str = ""
+    # Legacy individual API Keys (optional fallback, currently unused)
+    openai_api_key: str = Field(default="", repr=False)
+    anthropic_api_key: str = Field(default="", repr=False)
+    google_api_key: str = Field(default="", repr=False)
+    deepseek_api_key: str = Field(default="", repr=False)
     
     # App Settings - support both CORS_ORIGIN and CORS_ORIGINS
     cors_origins: str = ""
     cors_origin: str = ""  # Alternative name
     debug: bool = False
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-    
-    @property
-    def cors_origins_list(self) -> list[str]:
-        """Parse CORS origins from comma-separated string."""
+    @cached_property
+    def cors_origins_list(self) -> tuple[str, ...]:
+        """Parse CORS origins from comma-separated string (computed once)."""
         # Use whichever is set: cors_origins or cors_origin
-        origins_str = self.cors_origins or self.cors_origin or "http://localhost:3000"
+        origins_str = (self.cors_origins or self.cors_origin).strip()
+        
+        # Common case: nothing or a single origin configured
+        if "," not in origins_str:
+            if not origins_str or origins_str in _DEFAULT_ORIGINS:
+                return _DEFAULT_ORIGINS
+            return (origins_str, *_DEFAULT_ORIGINS)
+        
         origins = [origin.strip() for origin in origins_str.split(",") if origin.strip()]
-        # Always include common development origins
-        default_origins = ["http://localhost:3000", "http://localhost:3001"]
-        all_origins = list(set(origins + default_origins))
-        print(f"🔒 CORS origins configured: {all_origins}")
-        return all_origins
+        # Always include common development origins (dict.fromkeys keeps order)
+        return tuple(dict.fromkeys(origins + list(_DEFAULT_ORIGINS)))
     
     @property
     def use_mock_db(self) -> bool:
@@ -48,7 +59,7 @@ class Settings(BaseSettings):
         return not self.supabase_url or not self.supabase_key
 
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     """Cached settings instance."""
     return Settings()
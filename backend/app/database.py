@@ -3,21 +3,24 @@ Supabase database connection and client.
 """
 
 from supabase import create_client, Client
-from functools import lru_cache
+from functools import cache
 from app.config import get_settings
 
 
-@lru_cache()
+@cache
 def get_supabase_client() -> Client:
     """
     Create and cache Supabase client.
-    Uses lru_cache to ensure single instance.
+    Uses functools.cache to ensure single instance.
     """
     settings = get_settings()
     return create_client(settings.supabase_url, settings.supabase_key)
 
 
-def get_db() -> Client:
-    """Dependency for FastAPI routes."""
+async def get_db() -> Client:
+    """
+    Dependency for FastAPI routes.
+    Async so FastAPI calls it inline instead of via the threadpool.
+    """
     return get_supabase_client()
 
@@ -0,0 +1,40 @@
+"""
+FastAPI dependencies for shared service instances.
+
+Services are created on first use and kept on app.state, so handlers
+don't rebuild them on every request. Creation is deferred (rather than
+done in main.lifespan) so the app still starts, and /health still answers,
+when Supabase isn't configured. The client comes from get_db, so
+dependency overrides of get_db reach the services too. The dependencies
+are async so FastAPI resolves them without a threadpool hop; with no await
+between the check and the assignment, only one instance is ever created.
+"""
+
+from fastapi import Depends, Request
+from supabase import Client
+
+from app.database import get_db
+from app.services.battle_service import BattleService
+from app.services.rating_service import RatingService
+
+
+async def get_battle_service(
+    request: Request,
+    db: Client = Depends(get_db)
+) -> BattleService:
+    """Dependency returning the app-wide BattleService."""
+    state = request.app.state
+    if getattr(state, "battle_service", None) is None:
+        state.battle_service = BattleService(db)
+    return state.battle_service
+
+
+async def get_rating_service(
+    request: Request,
+    db: Client = Depends(get_db)
+) -> RatingService:
+    """Dependency returning the app-wide RatingService."""
+    state = request.app.state
+    if getattr(state, "rating_service", None) is None:
+        state.rating_service = RatingService(db)
+    return state.rating_service
@@ -4,9 +4,11 @@ Chemistry Arena API - FastAPI Application Entry Point
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.config import get_settings
+from app.middleware import UnhandledErrorMiddleware
 from app.routers import battles, leaderboard, models
 
 
@@ -28,8 +30,13 @@ app = FastAPI(
     description="Backend API for Chemistry Arena - AI model comparison platform",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Turn unhandled errors into 500s; added before CORS so it runs inside
+# CORSMiddleware and error responses keep their CORS headers
+app.add_middleware(UnhandledErrorMiddleware)
+
 # Configure CORS
 settings = get_settings()
 app.add_middleware(
@@ -0,0 +1,48 @@
+"""
+ASGI middleware.
+"""
+
+import logging
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+logger = logging.getLogger(__name__)
+
+
+class UnhandledErrorMiddleware:
+    """
+    Return any unhandled error as a 500 with its message as detail.
+    
+    FastAPI's Exception handlers run in the outermost middleware, outside
+    CORSMiddleware, so their responses lack CORS headers and browsers hide
+    the body from the frontend. Registered before CORSMiddleware, this
+    middleware sits inside it and the 500 gets the usual headers.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            # Too late to replace a response that is already streaming
+            if response_started:
+                raise
+            logger.exception("Unhandled error")
+            response = ORJSONResponse(status_code=500, content={"detail": str(exc)})
+            await response(scope, receive, send)
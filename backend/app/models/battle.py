@@ -6,10 +6,12 @@ from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional, Literal
 
+from app.models.leaderboard import CategoryEnum
+
 
 class BattleCreate(BaseModel):
     """Request to create a new battle."""
-    category: Optional[str] = None  # If None, random category
+    category: Optional[CategoryEnum] = None  # If None, random category
 
 
 class BattleResponse(BaseModel):
@@ -5,6 +5,14 @@ Leaderboard-related Pydantic models.
 from pydantic import BaseModel
 from typing import Optional, Literal
 from datetime import datetime
+from enum import Enum
+
+
+class CategoryEnum(str, Enum):
+    """Valid chemistry categories."""
+    ADMET = "admet"
+    OPTIMIZATION = "optimization"
+    NOTATION = "notation"
 
 
 class ModelStats(BaseModel):
@@ -0,0 +1,23 @@
+"""
+Pre-serialized JSON responses for hot endpoints.
+
+Returning a Response from a route skips FastAPI's response_model round trip
+(dump to dict -> re-validate -> encode). Instead the Pydantic models are
+serialized once, directly to JSON bytes, by pydantic-core. Routes still
+declare response_model so the OpenAPI schema is unchanged.
+"""
+
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+def model_response(model: BaseModel) -> Response:
+    """Serialize a single response model."""
+    return Response(model.model_dump_json(), media_type="application/json")
+
+
+def list_response(adapter: TypeAdapter, items: list[Any]) -> Response:
+    """Serialize a list of response models using a prebuilt TypeAdapter."""
+    return Response(adapter.dump_json(items), media_type="application/json")
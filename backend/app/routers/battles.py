@@ -3,11 +3,11 @@ Battle API endpoints.
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from supabase import Client
 
-from app.database import get_db
+from app.dependencies import get_battle_service, get_rating_service
 from app.models.battle import BattleCreate, BattleResponse, BattleResult
 from app.models.vote import VoteCreate, VoteResponse
+from app.responses import model_response
 from app.services.battle_service import BattleService
 from app.services.rating_service import RatingService
 
@@ -17,7 +17,7 @@ router = APIRouter()
 @router.post("/new", response_model=BattleResponse)
 async def create_battle(
     request: BattleCreate,
-    db: Client = Depends(get_db)
+    battle_service: BattleService = Depends(get_battle_service)
 ):
     """
     Create a new battle.
@@ -27,19 +27,17 @@ async def create_battle(
     - Calls LLM APIs to generate responses
     - Returns battle data (model identities hidden)
     """
-    battle_service = BattleService(db)
-    try:
-        battle = await battle_service.create_battle(category=request.category)
-        return battle
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    category = request.category.value if request.category else None
+    battle = await battle_service.create_battle(category=category)
+    return model_response(battle)
 
 
 @router.post("/{battle_id}/vote", response_model=VoteResponse)
 async def submit_vote(
     battle_id: str,
     request: VoteCreate,
-    db: Client = Depends(get_db)
+    battle_service: BattleService = Depends(get_battle_service),
+    rating_service: RatingService = Depends(get_rating_service)
 ):
     """
     Submit a vote for a battle.
@@ -48,9 +46,6 @@ async def submit_vote(
     - Updates model ratings using Bradley-Terry
     - Returns vote confirmation with revealed model identities
     """
-    battle_service = BattleService(db)
-    rating_service = RatingService(db)
-    
     try:
         # Record the vote
         vote = await battle_service.record_vote(
@@ -65,22 +60,18 @@ async def submit_vote(
         return vote
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/{battle_id}", response_model=BattleResult)
 async def get_battle(
     battle_id: str,
-    db: Client = Depends(get_db)
+    battle_service: BattleService = Depends(get_battle_service)
 ):
     """
     Get battle details (after voting).
     """
-    battle_service = BattleService(db)
     try:
-        battle = await battle_service.get_battle_result(battle_id)
-        return battle
+        return await battle_service.get_battle_result(battle_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
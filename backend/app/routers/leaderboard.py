@@ -2,72 +2,54 @@
 Leaderboard API endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from supabase import Client
-from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 
-from app.database import get_db
-from app.models.leaderboard import LeaderboardResponse, CategoryInfo
+from app.dependencies import get_rating_service
+from app.models.leaderboard import LeaderboardResponse, CategoryInfo, CategoryEnum
+from app.responses import list_response, model_response
 from app.services.rating_service import RatingService
 
 router = APIRouter()
 
+_CATEGORY_LIST = TypeAdapter(list[CategoryInfo])
+
 
 @router.get("", response_model=LeaderboardResponse)
 async def get_overall_leaderboard(
     limit: int = Query(default=20, ge=1, le=100),
-    db: Client = Depends(get_db)
+    rating_service: RatingService = Depends(get_rating_service)
 ):
     """
     Get overall leaderboard across all categories.
     """
-    rating_service = RatingService(db)
-    try:
-        leaderboard = await rating_service.get_leaderboard(limit=limit)
-        return leaderboard
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    leaderboard = await rating_service.get_leaderboard(limit=limit)
+    return model_response(leaderboard)
 
 
 @router.get("/categories", response_model=list[CategoryInfo])
-async def get_categories(db: Client = Depends(get_db)):
+async def get_categories(
+    rating_service: RatingService = Depends(get_rating_service)
+):
     """
     Get list of available chemistry categories.
     """
-    rating_service = RatingService(db)
-    try:
-        categories = await rating_service.get_categories()
-        return categories
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    categories = await rating_service.get_categories()
+    return list_response(_CATEGORY_LIST, categories)
 
 
 @router.get("/{category}", response_model=LeaderboardResponse)
 async def get_category_leaderboard(
-    category: str,
+    category: CategoryEnum,
     limit: int = Query(default=20, ge=1, le=100),
-    db: Client = Depends(get_db)
+    rating_service: RatingService = Depends(get_rating_service)
 ):
     """
     Get leaderboard for a specific chemistry category.
     """
-    valid_categories = [
-        "admet", "optimization", "notation"
-    ]
-    
-    if category not in valid_categories:
-        raise HTTPException(
-            status_code=400, 
-            detail=f"Invalid category. Must be one of: {', '.join(valid_categories)}"
-        )
-    
-    rating_service = RatingService(db)
-    try:
-        leaderboard = await rating_service.get_leaderboard(
-            category=category, 
-            limit=limit
-        )
-        return leaderboard
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    leaderboard = await rating_service.get_leaderboard(
+        category=category.value,
+        limit=limit
+    )
+    return model_response(leaderboard)
 
@@ -2,15 +2,22 @@
 Models API endpoints.
 """
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import TypeAdapter
 from supabase import Client
 from typing import Optional
 
 from app.database import get_db
 from app.models.battle import ModelInfo, PromptInfo
+from app.responses import list_response
+from app.services.catalog_cache import get_models_cached
 
 router = APIRouter()
 
+_MODEL_LIST = TypeAdapter(list[ModelInfo])
+
 
 @router.get("", response_model=list[ModelInfo])
 async def get_models(
@@ -20,26 +27,8 @@ async def get_models(
     """
     Get list of available LLM models.
     """
-    try:
-        query = db.table("models").select("*")
-        if active_only:
-            query = query.eq("is_active", True)
-        
-        result = query.execute()
-        
-        return [
-            ModelInfo(
-                id=m["id"],
-                name=m["name"],
-                provider=m["provider"],
-                description=m.get("description"),
-                is_new=m.get("is_new", False),
-                is_active=m.get("is_active", True)
-            )
-            for m in result.data
-        ]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    models = await get_models_cached(db, active_only)
+    return list_response(_MODEL_LIST, list(models))
 
 
 @router.get("/{model_id}", response_model=ModelInfo)
@@ -50,25 +39,21 @@ async def get_model(
     """
     Get details for a specific model.
     """
-    try:
-        result = db.table("models").select("*").eq("id", model_id).single().execute()
-        
-        if not result.data:
-            raise HTTPException(status_code=404, detail="Model not found")
-        
-        m = result.data
-        return ModelInfo(
-            id=m["id"],
-            name=m["name"],
-            provider=m["provider"],
-            description=m.get("description"),
-            is_new=m.get("is_new", False),
-            is_active=m.get("is_active", True)
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    query = db.table("models").select("*").eq("id", model_id).single()
+    result = await asyncio.to_thread(query.execute)
+    
+    if not result.data:
+        raise HTTPException(status_code=404, detail="Model not found")
+    
+    m = result.data
+    return ModelInfo.model_construct(
+        id=m["id"],
+        name=m["name"],
+        provider=m["provider"],
+        description=m.get("description"),
+        is_new=m.get("is_new", False),
+        is_active=m.get("is_active", True)
+    )
 
 
 @router.get("/prompts/", response_model=list[PromptInfo])
@@ -79,22 +64,19 @@ async def get_prompts(
     """
     Get list of chemistry prompts.
     """
-    try:
-        query = db.table("prompts").select("*")
-        if category:
-            query = query.eq("category", category)
-        
-        result = query.execute()
-        
-        return [
-            PromptInfo(
-                id=p["id"],
-                category=p["category"],
-                difficulty=p["difficulty"],
-                text=p["text"]
-            )
-            for p in result.data
-        ]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    query = db.table("prompts").select("*")
+    if category:
+        query = query.eq("category", category)
+    
+    result = await asyncio.to_thread(query.execute)
+    
+    return [
+        PromptInfo.model_construct(
+            id=p["id"],
+            category=p["category"],
+            difficulty=p["difficulty"],
+            text=p["text"]
+        )
+        for p in result.data
+    ]
 
@@ -2,7 +2,9 @@
 Battle Service - Manages battle creation and voting.
 """
 
+import asyncio
 import random
+import sys
 from typing import Optional, Literal
 from datetime import datetime
 import uuid
@@ -11,9 +13,40 @@ from supabase import Client
 
 from app.models.battle import BattleResponse, BattleResult, ModelInfo, PromptInfo
 from app.models.vote import VoteResponse
+from app.services.catalog_cache import (
+    get_cached,
+    get_model_rows_cached,
+    get_models_cached,
+    invalidate_models_cache,
+)
 from app.services.llm_service import LLMService
 
 
+# PostgREST select for record_vote: only the model ids and names, so the
+# (often multi-KB) LLM responses aren't shipped over the wire
+_BATTLE_WITH_MODELS = (
+    "id, model_a_id, model_b_id, models_a:model_a_id(name), models_b:model_b_id(name)"
+)
+
+# Prompts change rarely, so cache them in memory instead of hitting
+# Supabase on every battle. Models are cached in catalog_cache.
+# category -> (expires_at, rows), see catalog_cache.get_cached
+_PROMPT_CACHE: dict[Optional[str], tuple[float, list[dict]]] = {}
+
+
+def invalidate_caches() -> None:
+    """Drop cached prompts and models (e.g. after an admin update)."""
+    _PROMPT_CACHE.clear()
+    invalidate_models_cache()
+
+
+def _parse_ts(value: str) -> datetime:
+    """Parse a Supabase ISO-8601 timestamp (which may end in 'Z')."""
+    if sys.version_info >= (3, 11) or not value.endswith("Z"):
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value[:-1] + "+00:00")
+
+
 class BattleService:
     """
     Service for managing battles between AI models.
@@ -28,6 +61,11 @@ class BattleService:
             use_mock_llm: If True, use mock LLM responses (for testing)
         """
         self.db = db
+        # Root query builders; select()/insert() return fresh builders,
+        # so these can be reused across calls
+        self._battles = db.table("battles")
+        self._votes = db.table("votes")
+        self._prompts = db.table("prompts")
         self.llm_service = LLMService(use_mock=use_mock_llm)
     
     async def create_battle(
@@ -43,11 +81,11 @@ class BattleService:
         4. Store battle in database
         5. Return battle data (model identities hidden)
         """
-        # Get a random prompt
-        prompt = await self._get_random_prompt(category)
-        
-        # Get two random models
-        model_a, model_b = await self._get_random_model_pair()
+        # Get a random prompt and two random models concurrently
+        prompt, (model_a, model_b) = await asyncio.gather(
+            self._get_random_prompt(category),
+            self._get_random_model_pair(),
+        )
         
         # Generate responses from both models
         response_a, response_b = await self.llm_service.generate_battle_responses(
@@ -67,7 +105,9 @@ class BattleService:
             "response_b": response_b,
         }
         
-        result = self.db.table("battles").insert(battle_data).execute()
+        result = await asyncio.to_thread(
+            self._battles.insert(battle_data).execute
+        )
         battle = result.data[0]
         
         return BattleResponse(
@@ -80,7 +120,7 @@ class BattleService:
             model_b_id=model_b["id"],
             response_a=response_a,
             response_b=response_b,
-            created_at=datetime.fromisoformat(battle["created_at"].replace("Z", "+00:00"))
+            created_at=_parse_ts(battle["created_at"])
         )
     
     async def record_vote(
@@ -101,11 +141,11 @@ class BattleService:
             VoteResponse with vote confirmation and revealed model info
         """
         # Verify battle exists and get model info
-        battle_result = self.db.table("battles") \
-            .select("*, models_a:model_a_id(id, name, provider), models_b:model_b_id(id, name, provider)") \
+        query = self._battles \
+            .select(_BATTLE_WITH_MODELS) \
             .eq("id", battle_id) \
-            .single() \
-            .execute()
+            .single()
+        battle_result = await asyncio.to_thread(query.execute)
         
         if not battle_result.data:
             raise ValueError(f"Battle not found: {battle_id}")
@@ -119,7 +159,9 @@ class BattleService:
             "voter_session": voter_session,
         }
         
-        vote_result = self.db.table("votes").insert(vote_data).execute()
+        vote_result = await asyncio.to_thread(
+            self._votes.insert(vote_data).execute
+        )
         vote = vote_result.data[0]
         
         return VoteResponse(
@@ -130,7 +172,7 @@ class BattleService:
             model_a_name=battle["models_a"]["name"] if battle.get("models_a") else battle["model_a_id"],
             model_b_id=battle["model_b_id"],
             model_b_name=battle["models_b"]["name"] if battle.get("models_b") else battle["model_b_id"],
-            created_at=datetime.fromisoformat(vote["created_at"].replace("Z", "+00:00")),
+            created_at=_parse_ts(vote["created_at"]),
             message="Vote recorded successfully! Ratings updated."
         )
     
@@ -140,111 +182,63 @@ class BattleService:
         
         This is called after voting to show the user which models they compared.
         """
-        # Get battle with related data
-        result = self.db.table("battles") \
-            .select("""
-                *,
-                prompts(text, category),
-                models_a:model_a_id(id, name, provider),
-                models_b:model_b_id(id, name, provider),
-                votes(winner)
-            """) \
-            .eq("id", battle_id) \
-            .single() \
-            .execute()
+        # Single round trip: the RPC joins prompt and models and resolves
+        # the most recent vote server-side (see supabase_schema.sql)
+        result = await asyncio.to_thread(
+            self.db.rpc("get_battle_result", {"p_id": battle_id}).execute
+        )
         
         if not result.data:
             raise ValueError(f"Battle not found: {battle_id}")
         
-        battle = result.data
-        
-        # Get the most recent vote for this battle
-        latest_vote = battle.get("votes", [{}])[-1] if battle.get("votes") else {}
-        winner = latest_vote.get("winner", "tie")
-        
-        return BattleResult(
-            id=battle["id"],
-            prompt_text=battle["prompts"]["text"],
-            prompt_category=battle["prompts"]["category"],
-            model_a_id=battle["model_a_id"],
-            model_a_name=battle["models_a"]["name"],
-            model_a_provider=battle["models_a"]["provider"],
-            model_b_id=battle["model_b_id"],
-            model_b_name=battle["models_b"]["name"],
-            model_b_provider=battle["models_b"]["provider"],
-            response_a=battle["response_a"],
-            response_b=battle["response_b"],
-            winner=winner
-        )
+        return BattleResult(**result.data)
     
     async def _get_random_prompt(
         self,
         category: Optional[str] = None
     ) -> dict:
         """Get a random prompt, optionally filtered by category."""
-        query = self.db.table("prompts").select("*")
+        def fetch() -> list[dict]:
+            query = self._prompts.select("*")
+            if category:
+                query = query.eq("category", category)
+            return query.execute().data
         
-        if category:
-            query = query.eq("category", category)
+        prompts = await get_cached(_PROMPT_CACHE, category, fetch)
         
-        result = query.execute()
-        
-        if not result.data:
+        if not prompts:
             raise ValueError(f"No prompts found for category: {category}")
         
-        return random.choice(result.data)
+        return random.choice(prompts)
     
     async def _get_random_model_pair(self) -> tuple[dict, dict]:
         """Get two random active models."""
-        result = self.db.table("models") \
-            .select("*") \
-            .eq("is_active", True) \
-            .execute()
+        models = await get_model_rows_cached(self.db, active_only=True)
         
-        if len(result.data) < 2:
+        if len(models) < 2:
             raise ValueError("Not enough active models for a battle")
         
-        # Shuffle and pick two
-        models = result.data.copy()
-        random.shuffle(models)
-        
-        return models[0], models[1]
+        model_a, model_b = random.sample(models, 2)
+        return model_a, model_b
     
     async def get_models(self, active_only: bool = True) -> list[ModelInfo]:
         """Get list of available models."""
-        query = self.db.table("models").select("*")
-        
-        if active_only:
-            query = query.eq("is_active", True)
-        
-        result = query.execute()
-        
-        return [
-            ModelInfo(
-                id=m["id"],
-                name=m["name"],
-                provider=m["provider"],
-                description=m.get("description"),
-                is_new=m.get("is_new", False),
-                is_active=m.get("is_active", True)
-            )
-            for m in result.data
-        ]
+        return list(await get_models_cached(self.db, active_only))
     
     async def get_prompts(
         self,
         category: Optional[str] = None
     ) -> list[PromptInfo]:
         """Get list of prompts, optionally filtered by category."""
-        query = self.db.table("prompts").select("*")
+        query = self._prompts.select("*")
         
         if category:
             query = query.eq("category", category)
         
-        result = query.execute()
+        result = await asyncio.to_thread(query.execute)
         
         return [
-            PromptInfo(
+            PromptInfo.model_construct(
                 id=p["id"],
                 category=p["category"],
                 difficulty=p["difficulty"],
@@ -0,0 +1,90 @@
+"""
+Catalog Cache - In-memory TTL caches for catalog data.
+
+The models and prompts tables are small and change rarely, so they are
+served from memory instead of querying Supabase (and re-validating every
+row) per request. get_cached is the shared helper; prompts are cached
+with it in battle_service.
+"""
+
+import asyncio
+import time
+from typing import Callable, Hashable, TypeVar
+
+from supabase import Client
+
+from app.models.battle import ModelInfo
+
+
+CACHE_TTL_SECONDS = 60
+
+# active_only -> (expires_at, (raw rows, ModelInfo objects)),
+# expiry from time.monotonic()
+_MODEL_CACHE: dict[bool, tuple[float, tuple[list[dict], tuple[ModelInfo, ...]]]] = {}
+_lock = asyncio.Lock()
+
+T = TypeVar("T")
+
+
+def invalidate_models_cache() -> None:
+    """Drop cached model rows so the next request refetches them."""
+    _MODEL_CACHE.clear()
+
+
+async def get_cached(cache: dict, key: Hashable, fetch: Callable[[], T]) -> T:
+    """
+    Return the cached value for key, refetching it once expired.
+    
+    Entries are (expires_at, value). fetch is a blocking Supabase call,
+    so it runs in a worker thread; the lock keeps concurrent misses from
+    all hitting the database.
+    """
+    entry = cache.get(key)
+    if entry is None or time.monotonic() >= entry[0]:
+        async with _lock:
+            # Another request may have refreshed it while we waited
+            entry = cache.get(key)
+            if entry is None or time.monotonic() >= entry[0]:
+                value = await asyncio.to_thread(fetch)
+                entry = (time.monotonic() + CACHE_TTL_SECONDS, value)
+                cache[key] = entry
+    return entry[1]
+
+
+async def _load_models(
+    db: Client,
+    active_only: bool
+) -> tuple[list[dict], tuple[ModelInfo, ...]]:
+    """Return (raw rows, ModelInfo objects) for active_only."""
+    def fetch() -> tuple[list[dict], tuple[ModelInfo, ...]]:
+        query = db.table("models").select("*")
+        if active_only:
+            query = query.eq("is_active", True)
+        rows = query.execute().data
+        
+        models = tuple(
+            ModelInfo.model_construct(
+                id=m["id"],
+                name=m["name"],
+                provider=m["provider"],
+                description=m.get("description"),
+                is_new=m.get("is_new", False),
+                is_active=m.get("is_active", True)
+            )
+            for m in rows
+        )
+        return rows, models
+    
+    return await get_cached(_MODEL_CACHE, active_only, fetch)
+
+
+async def get_model_rows_cached(db: Client, active_only: bool = True) -> list[dict]:
+    """Get raw model rows as returned by Supabase."""
+    rows, _ = await _load_models(db, active_only)
+    return rows
+
+
+async def get_models_cached(db: Client, active_only: bool = True) -> tuple[ModelInfo, ...]:
+    """Get models as already-constructed ModelInfo objects."""
+    _, models = await _load_models(db, active_only)
+    return models
@@ -9,19 +9,44 @@ P(i > j) = p_i / (p_i + p_j)
 
 where p_i and p_j are the strength parameters.
 
-This is a Python port of the TypeScript implementation in bradley-terry.ts
+Strengths are fitted with Newman's accelerated update, regularized with
+virtual tied games between every pair of models. The fit therefore no
+longer matches the TypeScript implementation in src/lib/bradley-terry.ts.
 """
 
-from typing import Optional, Literal
-from datetime import datetime
+import asyncio
+from typing import Iterator, Optional, Literal
+from datetime import datetime, timezone
 from dataclasses import dataclass
-import math
+from collections import Counter
+import time
 
+import numpy as np
+from numba import njit
 from supabase import Client
 
 from app.models.leaderboard import LeaderboardEntry, LeaderboardResponse, CategoryInfo
 
 
+LEADERBOARD_CACHE_TTL_SECONDS = 30
+
+# Leaderboards only change when ratings are written, so reads are served
+# from memory keyed by a version that every rating write bumps.
+# (category, limit, votes_version) -> (fetched_at, response)
+_lb_cache: dict[tuple, tuple[float, LeaderboardResponse]] = {}
+# votes_version -> (fetched_at, categories)
+_categories_cache: dict[int, tuple[float, list[CategoryInfo]]] = {}
+_votes_version = 0
+
+
+def _bump_votes_version() -> None:
+    """Invalidate cached leaderboards after ratings change."""
+    global _votes_version
+    _votes_version += 1
+    _lb_cache.clear()
+    _categories_cache.clear()
+
+
 @dataclass
 class MatchResult:
     """A single match result."""
@@ -30,6 +55,109 @@ class MatchResult:
     winner: Literal["A", "B", "tie"]
 
 
+# A deduplicated match outcome: (model_a, model_b, winner, count)
+Outcome = tuple[str, str, str, int]
+
+
+def dedupe_matches(match_results: list[MatchResult]) -> list[Outcome]:
+    """
+    Collapse match results into weighted unique outcomes.
+    
+    The number of distinct (model_a, model_b, winner) triples is bounded
+    by 3 * n^2 regardless of vote volume, so downstream passes are O(n^2)
+    instead of O(votes).
+    """
+    counts = Counter((m.model_a, m.model_b, m.winner) for m in match_results)
+    return outcomes_from_counts(counts)
+
+
+def outcomes_from_counts(counts: Counter) -> list[Outcome]:
+    """Flatten a Counter of (model_a, model_b, winner) keys into outcomes."""
+    return [(a, b, w, n) for (a, b, w), n in counts.items()]
+
+
+_WINNER_CODES = {"A": 0, "B": 1, "tie": 2}
+
+
+@dataclass
+class MatchArrays:
+    """
+    Outcomes as parallel integer arrays (struct-of-arrays layout).
+    
+    Indices refer to positions in a model list (-1 for models outside it);
+    winner codes are 0 = A, 1 = B, 2 = tie.
+    """
+    a_idx: np.ndarray
+    b_idx: np.ndarray
+    winner_code: np.ndarray
+    count: np.ndarray
+    
+    @classmethod
+    def from_outcomes(
+        cls,
+        model_idx: dict[str, int],
+        outcomes: list[Outcome]
+    ) -> "MatchArrays":
+        """Encode outcomes against a model_id -> index mapping."""
+        rows = [
+            (model_idx.get(a, -1), model_idx.get(b, -1), _WINNER_CODES.get(w, 2), count)
+            for a, b, w, count in outcomes
+        ]
+        a_idx, b_idx, winner_code, count = np.array(rows, dtype=np.intp).reshape(-1, 4).T
+        return cls(a_idx=a_idx, b_idx=b_idx, winner_code=winner_code, count=count)
+
+
+def _win_matrices(
+    n: int,
+    arrays: MatchArrays,
+    group: np.ndarray,
+    n_groups: int
+) -> np.ndarray:
+    """
+    Accumulate win matrices for n_groups outcome groups in one pass.
+    
+    W[g, i, j] is how often model i beat model j within group g (ties
+    count 0.5 for each side); group[k] is the group of outcome k.
+    """
+    a_idx, b_idx, code, count = arrays.a_idx, arrays.b_idx, arrays.winner_code, arrays.count
+    
+    # Skip matches involving models outside the rated set (e.g. inactive)
+    rated = (a_idx >= 0) & (b_idx >= 0)
+    
+    W = np.zeros((n_groups, n, n), dtype=np.float64)
+    a_wins = rated & (code == 0)
+    b_wins = rated & (code == 1)
+    ties = rated & (code == 2)
+    np.add.at(W, (group[a_wins], a_idx[a_wins], b_idx[a_wins]), count[a_wins])
+    np.add.at(W, (group[b_wins], b_idx[b_wins], a_idx[b_wins]), count[b_wins])
+    np.add.at(W, (group[ties], a_idx[ties], b_idx[ties]), 0.5 * count[ties])
+    np.add.at(W, (group[ties], b_idx[ties], a_idx[ties]), 0.5 * count[ties])
+    diagonal = np.arange(n)
+    W[:, diagonal, diagonal] = 0.0
+    
+    return W
+
+
+def build_win_matrices(models: list[str], groups: list[list[Outcome]]) -> np.ndarray:
+    """
+    Build the win matrix of every outcome group in a single pass.
+    
+    Args:
+        models: Model ids; matrix rows/columns follow this order
+        groups: One outcome list per group (e.g. overall, then each category)
+    
+    Returns:
+        Array of shape (len(groups), n, n)
+    """
+    model_idx = {model: i for i, model in enumerate(models)}
+    arrays = MatchArrays.from_outcomes(
+        model_idx,
+        [outcome for outcomes in groups for outcome in outcomes]
+    )
+    group = np.repeat(np.arange(len(groups)), [len(outcomes) for outcomes in groups])
+    return _win_matrices(len(models), arrays, group, len(groups))
+
+
 @dataclass
 class BradleyTerryResult:
     """Result of Bradley-Terry estimation."""
@@ -38,6 +166,163 @@ class BradleyTerryResult:
     converged: bool
 
 
+# Convergence criteria understood by _bt_iterate
+ConvergenceCriterion = Literal["abs", "rel", "any"]
+_CRITERION_CODES = {"abs": 0, "rel": 1, "any": 2}
+
+
+@njit(cache=True, fastmath=True)
+def _bt_iterate(
+    W: np.ndarray,
+    p: np.ndarray,
+    max_iterations: int,
+    tol: float,
+    criterion: int
+) -> tuple[np.ndarray, int, bool]:
+    """
+    Newman's accelerated fixed-point iteration for Bradley-Terry strengths.
+    
+        p_i <- sum_j (W[i, j] * p_j / (p_i + p_j)) / sum_j (W[j, i] / (p_i + p_j))
+    
+    Same fixed point as Zermelo's classic update but converges in far fewer
+    iterations. Ratings are updated in place (Gauss-Seidel, as in Newman's
+    paper): a simultaneous (Jacobi) update of every p_i oscillates instead
+    of converging, e.g. for two models the ratio just flips each step.
+    Loops are fused so no n x n temporaries are allocated.
+    
+    The update is homogeneous in p, so the fixed point is only defined up
+    to scale: ratings are left unnormalized while iterating and rescaled to
+    sum to n once at the end.
+    
+    criterion selects the stopping test against tol: 0 = absolute change,
+    1 = relative change (max |log(new / old)|, scale-invariant), 2 = either.
+    
+    Returns:
+        Tuple of (ratings, iterations, converged)
+    """
+    n = p.shape[0]
+    p = p.copy()
+    
+    iteration = 0
+    converged = n == 0
+    
+    while iteration < max_iterations and not converged:
+        max_change = 0.0
+        max_rel_change = 0.0
+        
+        for i in range(n):
+            num = 0.0
+            den = 0.0
+            for j in range(n):
+                if i != j:
+                    pair_sum = p[i] + p[j]
+                    num += W[i, j] * p[j] / pair_sum
+                    den += W[j, i] / pair_sum
+            
+            # W has no zero off-diagonal entries (see virtual ties in
+            # estimate), so den > 0 and ratings stay positive
+            new_rating = num / den
+            
+            # Track convergence
+            change = abs(new_rating - p[i])
+            if change > max_change:
+                max_change = change
+            rel_change = abs(np.log(new_rating / p[i]))
+            if rel_change > max_rel_change:
+                max_rel_change = rel_change
+            
+            # Later rows in this sweep already see the updated rating
+            p[i] = new_rating
+        
+        iteration += 1
+        if criterion == 0:
+            converged = max_change < tol
+        elif criterion == 1:
+            converged = max_rel_change < tol
+        else:
+            converged = max_change < tol or max_rel_change < tol
+    
+    # Normalize once (ratings sum to number of models)
+    if n > 0:
+        p *= n / p.sum()
+    
+    return p, iteration, converged
+
+
+# Default Bradley-Terry estimator settings
+DEFAULT_MAX_ITERATIONS = 200
+DEFAULT_CONVERGENCE_THRESHOLD = 0.0001
+DEFAULT_VIRTUAL_TIE_WEIGHT = 1.0
+DEFAULT_CRITERION: ConvergenceCriterion = "rel"
+
+
+def fit_win_matrix(
+    models: list[str],
+    W: np.ndarray,
+    *,
+    max_iterations: int,
+    convergence_threshold: float,
+    virtual_tie_weight: float,
+    criterion: ConvergenceCriterion
+) -> BradleyTerryResult:
+    """
+    Fit Bradley-Terry strengths to a win matrix and convert them to Elo.
+    
+    Args:
+        models: Model ids; W rows/columns follow this order
+        W: Win matrix (see build_win_matrices); not modified
+        max_iterations, convergence_threshold, criterion: Stopping rule
+            for _bt_iterate
+        virtual_tie_weight: Virtual tied games added between every pair
+    """
+    # With fewer than two models there is nothing to compare (and no
+    # off-diagonal entries, so the update would divide 0 by 0)
+    if len(models) < 2:
+        return BradleyTerryResult(
+            ratings={model: 1500 for model in models},
+            iterations=0,
+            converged=True
+        )
+    
+    # Regularize with virtual tied games between every pair of models
+    # (one by default): a prior that pulls ratings toward the mean so
+    # sparse or one-sided records give moderate ratings instead of
+    # extreme ones, and a fully connected comparison graph, so the MLE
+    # is unique and the iteration converges quickly
+    W = W + virtual_tie_weight / 2
+    np.fill_diagonal(W, 0.0)
+    
+    # Initialize all ratings to 1
+    n = len(models)
+    p, iteration, converged = _bt_iterate(
+        W,
+        np.ones(n, dtype=np.float64),
+        max_iterations,
+        convergence_threshold,
+        _CRITERION_CODES[criterion]
+    )
+    
+    # Convert to Elo-style ratings (centered at 1500)
+    base_elo = 1500
+    scale_factor = 400
+    
+    # Use geometric mean as reference
+    positive = p > 0
+    log_mean = np.log(p[positive]).sum() / len(models) if models else 0.0
+    reference_power = np.exp(log_mean)
+    
+    # Non-positive strengths fall back to the base rating
+    relative = np.where(positive, p / reference_power, 1.0)
+    elo = np.round(base_elo + scale_factor * np.log10(relative)).astype(int)
+    elo_ratings: dict[str, float] = dict(zip(models, elo.tolist()))
+    
+    return BradleyTerryResult(
+        ratings=elo_ratings,
+        iterations=int(iteration),
+        converged=bool(converged)
+    )
+
+
 class BradleyTerryModel:
     """
     Bradley-Terry model implementation for estimating model strengths.
@@ -47,166 +332,130 @@ class BradleyTerryModel:
         self,
         models: list[str],
         match_results: list[MatchResult],
-        max_iterations: int = 200,
-        convergence_threshold: float = 0.0001
+        max_iterations: int = DEFAULT_MAX_ITERATIONS,
+        convergence_threshold: float = DEFAULT_CONVERGENCE_THRESHOLD,
+        virtual_tie_weight: float = DEFAULT_VIRTUAL_TIE_WEIGHT,
+        criterion: ConvergenceCriterion = DEFAULT_CRITERION
     ):
         self.models = models
         self.match_results = match_results
+        self.outcomes = dedupe_matches(match_results)
         self.max_iterations = max_iterations
         self.convergence_threshold = convergence_threshold
+        self.virtual_tie_weight = virtual_tie_weight
+        if criterion not in _CRITERION_CODES:
+            raise ValueError(f"Unknown convergence criterion: {criterion}")
+        self.criterion = criterion
+        # model_id -> number of matches, built on first calculate_confidence
+        self._match_count_cache: Optional[Counter] = None
     
-    def _compute_win_matrix(self) -> dict[str, dict[str, float]]:
-        """Compute win counts for each model against each other model."""
-        win_matrix: dict[str, dict[str, float]] = {}
-        
-        # Initialize matrix
-        for model in self.models:
-            win_matrix[model] = {other: 0.0 for other in self.models}
-        
-        # Count wins
-        for match in self.match_results:
-            if match.winner == "A":
-                win_matrix[match.model_a][match.model_b] += 1
-            elif match.winner == "B":
-                win_matrix[match.model_b][match.model_a] += 1
-            else:  # tie
-                win_matrix[match.model_a][match.model_b] += 0.5
-                win_matrix[match.model_b][match.model_a] += 0.5
-        
-        return win_matrix
-    
-    def _compute_comparison_counts(self) -> dict[str, dict[str, int]]:
-        """Compute total number of comparisons between each pair."""
-        counts: dict[str, dict[str, int]] = {}
-        
-        for model in self.models:
-            counts[model] = {other: 0 for other in self.models}
-        
-        for match in self.match_results:
-            counts[match.model_a][match.model_b] += 1
-            counts[match.model_b][match.model_a] += 1
+    def _build_win_matrix(self) -> np.ndarray:
+        """
+        Build the win matrix W.
         
-        return counts
+        W[i, j] is how often model i beat model j (ties count 0.5 for
+        each side), indexed by position in self.models.
+        """
+        return build_win_matrices(self.models, [self.outcomes])[0]
     
     def estimate(self) -> BradleyTerryResult:
         """Run the Bradley-Terry estimation algorithm."""
-        win_matrix = self._compute_win_matrix()
-        comparison_counts = self._compute_comparison_counts()
-        
-        # Initialize all ratings to 1
-        ratings = {model: 1.0 for model in self.models}
-        
-        iteration = 0
-        converged = False
-        
-        while iteration < self.max_iterations and not converged:
-            new_ratings: dict[str, float] = {}
-            max_change = 0.0
-            
-            for model in self.models:
-                # Compute total wins for this model
-                total_wins = sum(
-                    win_matrix[model][other]
-                    for other in self.models
-                    if other != model
-                )
-                
-                # Compute denominator sum
-                denom_sum = 0.0
-                for other in self.models:
-                    if other != model:
-                        n_comparisons = comparison_counts[model][other]
-                        if n_comparisons > 0:
-                            denom_sum += n_comparisons / (ratings[model] + ratings[other])
-                
-                # Update rating
-                if denom_sum > 0:
-                    new_ratings[model] = total_wins / denom_sum
-                else:
-                    new_ratings[model] = ratings[model]
-                
-                # Track convergence
-                change = abs(new_ratings[model] - ratings[model])
-                if change > max_change:
-                    max_change = change
-            
-            # Normalize ratings (sum to number of models)
-            rating_sum = sum(new_ratings.values())
-            norm_factor = len(self.models) / rating_sum if rating_sum > 0 else 1.0
-            for model in self.models:
-                ratings[model] = new_ratings[model] * norm_factor
-            
-            iteration += 1
-            converged = max_change < self.convergence_threshold
-        
-        # Convert to Elo-style ratings (centered at 1500)
-        elo_ratings: dict[str, float] = {}
-        base_elo = 1500
-        scale_factor = 400
-        
-        # Use geometric mean as reference
-        log_sum = sum(math.log(r) for r in ratings.values() if r > 0)
-        log_mean = log_sum / len(self.models) if self.models else 0
-        reference_power = math.exp(log_mean)
-        
-        for model in self.models:
-            if ratings[model] > 0 and reference_power > 0:
-                elo_ratings[model] = round(
-                    base_elo + scale_factor * math.log10(ratings[model] / reference_power)
-                )
-            else:
-                elo_ratings[model] = base_elo
+        return self.estimate_from_matrix(self._build_win_matrix())
+    
+    def estimate_from_matrix(self, W: np.ndarray) -> BradleyTerryResult:
+        """
+        Run the Bradley-Terry estimation on a prebuilt win matrix.
         
-        return BradleyTerryResult(
-            ratings=elo_ratings,
-            iterations=iteration,
-            converged=converged
+        Args:
+            W: Win matrix indexed by position in self.models (see
+                build_win_matrices); not modified
+        """
+        return fit_win_matrix(
+            self.models,
+            W,
+            max_iterations=self.max_iterations,
+            convergence_threshold=self.convergence_threshold,
+            virtual_tie_weight=self.virtual_tie_weight,
+            criterion=self.criterion
         )
     
     def calculate_confidence(self, model_id: str) -> float:
         """Calculate confidence interval based on number of matches."""
-        total_matches = sum(
-            1 for match in self.match_results
-            if match.model_a == model_id or match.model_b == model_id
-        )
+        if self._match_count_cache is None:
+            match_counts: Counter = Counter()
+            for a, b, _, count in self.outcomes:
+                match_counts[a] += count
+                if b != a:
+                    match_counts[b] += count
+            self._match_count_cache = match_counts
+        
+        total_matches = self._match_count_cache.get(model_id, 0)
         # Full confidence at 100+ matches
         return min(1.0, total_matches / 100)
 
 
-def calculate_win_rate(
-    model_id: str,
-    match_results: list[MatchResult]
-) -> tuple[int, int, int, float]:
+def calculate_all_win_rates(
+    model_ids: list[str],
+    outcomes: list[Outcome]
+) -> dict[str, tuple[int, int, int, float]]:
     """
-    Calculate win rate from match results.
+    Calculate win rates for all models in a single pass over the outcomes.
     
     Returns:
-        Tuple of (wins, losses, ties, win_rate)
+        Dict of model_id -> (wins, losses, ties, win_rate)
     """
-    wins = 0
-    losses = 0
-    ties = 0
-    
-    for match in match_results:
-        if match.model_a == model_id:
-            if match.winner == "A":
-                wins += 1
-            elif match.winner == "B":
-                losses += 1
-            else:
-                ties += 1
-        elif match.model_b == model_id:
-            if match.winner == "B":
-                wins += 1
-            elif match.winner == "A":
-                losses += 1
-            else:
-                ties += 1
+    m = len(model_ids)
+    model_idx = {model: i for i, model in enumerate(model_ids)}
+    arrays = MatchArrays.from_outcomes(model_idx, outcomes)
+    a_idx, b_idx, code, count = arrays.a_idx, arrays.b_idx, arrays.winner_code, arrays.count
+    
+    def tally(idx: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        mask = mask & (idx >= 0)
+        return np.bincount(idx[mask], weights=count[mask], minlength=m)
+    
+    wins = tally(a_idx, code == 0) + tally(b_idx, code == 1)
+    losses = tally(a_idx, code == 1) + tally(b_idx, code == 0)
+    ties = tally(a_idx, code == 2) + tally(b_idx, code == 2)
     
     total = wins + losses + ties
-    win_rate = (wins + ties * 0.5) / total if total > 0 else 0
+    win_rate = np.divide(
+        wins + ties * 0.5, total,
+        out=np.zeros(m, dtype=np.float64), where=total > 0
+    )
+    
+    return {
+        model_id: (int(w), int(l), int(t), float(r))
+        for model_id, w, l, t, r in zip(model_ids, wins, losses, ties, win_rate)
+    }
+
+
+def _fit_one(
+    category: Optional[str],
+    model_ids: list[str],
+    W: np.ndarray,
+    outcomes: list[Outcome]
+) -> tuple[Optional[str], dict[str, float], dict[str, tuple[int, int, int, float]]]:
+    """
+    Fit one Bradley-Terry model and tally its win rates.
     
-    return wins, losses, ties, win_rate
+    Args:
+        category: Category being fit, or None for overall
+        model_ids: Models to rate; W rows/columns follow this order
+        W: Win matrix for this category
+        outcomes: The deduplicated outcomes W was built from
+    
+    Returns:
+        Tuple of (category, Elo ratings, win rates)
+    """
+    result = fit_win_matrix(
+        model_ids,
+        W,
+        max_iterations=DEFAULT_MAX_ITERATIONS,
+        convergence_threshold=DEFAULT_CONVERGENCE_THRESHOLD,
+        virtual_tie_weight=DEFAULT_VIRTUAL_TIE_WEIGHT,
+        criterion=DEFAULT_CRITERION
+    )
+    return category, result.ratings, calculate_all_win_rates(model_ids, outcomes)
 
 
 class RatingService:
@@ -235,6 +484,9 @@ class RatingService:
         ),
     ]
     
+    # Votes fetched per request in recalculate_all_ratings
+    VOTES_PAGE_SIZE = 10000
+    
     def __init__(self, db: Client):
         self.db = db
     
@@ -250,25 +502,24 @@ class RatingService:
             category: If provided, get category-specific leaderboard
             limit: Maximum number of entries to return
         """
-        if category:
-            # Use category leaderboard view
-            result = self.db.table("leaderboard_by_category") \
-                .select("*") \
-                .eq("category", category) \
-                .order("elo", desc=True) \
-                .limit(limit) \
-                .execute()
-        else:
-            # Use overall leaderboard view
-            result = self.db.table("leaderboard_overall") \
-                .select("*") \
-                .order("elo", desc=True) \
-                .limit(limit) \
-                .execute()
+        key = (category, limit, _votes_version)
+        cached = _lb_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < LEADERBOARD_CACHE_TTL_SECONDS:
+            return cached[1]
+        
+        # Entries and total battle count in one round trip
+        # (see get_leaderboard_with_count in supabase_schema.sql)
+        result = await asyncio.to_thread(
+            self.db.rpc("get_leaderboard_with_count", {
+                "p_category": category,
+                "p_limit": limit
+            }).execute
+        )
+        data = result.data
         
         entries = []
-        for i, row in enumerate(result.data):
-            entries.append(LeaderboardEntry(
+        for i, row in enumerate(data["entries"]):
+            entries.append(LeaderboardEntry.model_construct(
                 rank=i + 1,
                 model_id=row["model_id"],
                 model_name=row["model_name"],
@@ -285,37 +536,40 @@ class RatingService:
                 rank_change=None
             ))
         
-        # Get total battle count
-        battle_count = self.db.table("battles").select("id", count="exact").execute()
-        total_battles = battle_count.count or 0
-        
-        return LeaderboardResponse(
+        leaderboard = LeaderboardResponse(
             category=category,
             entries=entries,
-            total_battles=total_battles,
-            last_updated=datetime.now()
+            total_battles=data["total_battles"] or 0,
+            last_updated=datetime.now(timezone.utc)
         )
+        _lb_cache[key] = (time.monotonic(), leaderboard)
+        return leaderboard
     
     async def get_categories(self) -> list[CategoryInfo]:
         """Get list of categories with battle counts."""
-        categories = []
+        version = _votes_version
+        cached = _categories_cache.get(version)
+        if cached is not None and time.monotonic() - cached[0] < LEADERBOARD_CACHE_TTL_SECONDS:
+            return list(cached[1])
         
-        for cat in self.CATEGORIES:
-            # Count battles in this category
-            result = self.db.table("battles") \
-                .select("id", count="exact") \
-                .eq("prompts.category", cat.id) \
-                .execute()
-            
-            categories.append(CategoryInfo(
+        # One grouped count instead of a query per category
+        result = await asyncio.to_thread(
+            self.db.rpc("get_category_battle_counts", {}).execute
+        )
+        counts = {row["category"]: row["total_battles"] for row in result.data}
+        
+        categories = [
+            CategoryInfo(
                 id=cat.id,
                 name=cat.name,
                 description=cat.description,
                 icon=cat.icon,
-                total_battles=result.count or 0
-            ))
-        
-        return categories
+                total_battles=counts.get(cat.id, 0)
+            )
+            for cat in self.CATEGORIES
+        ]
+        _categories_cache[version] = (time.monotonic(), categories)
+        return list(categories)
     
     async def update_ratings_for_vote(
         self,
@@ -329,10 +583,13 @@ class RatingService:
         overall and category-specific ratings.
         """
         # Call the database function
-        self.db.rpc("update_ratings_after_vote", {
-            "p_battle_id": battle_id,
-            "p_winner": winner
-        }).execute()
+        await asyncio.to_thread(
+            self.db.rpc("update_ratings_after_vote", {
+                "p_battle_id": battle_id,
+                "p_winner": winner
+            }).execute
+        )
+        _bump_votes_version()
     
     async def recalculate_all_ratings(self) -> None:
         """
@@ -341,74 +598,123 @@ class RatingService:
         This is useful for periodic batch updates or initial setup.
         """
         # Get all models
-        models_result = self.db.table("models") \
+        query = self.db.table("models") \
             .select("id") \
-            .eq("is_active", True) \
-            .execute()
+            .eq("is_active", True)
+        models_result = await asyncio.to_thread(query.execute)
         model_ids = [m["id"] for m in models_result.data]
         
-        # Get all votes with battle info
-        votes_result = self.db.table("votes") \
-            .select("*, battles(model_a_id, model_b_id, prompts(category))") \
-            .execute()
-        
-        # Convert to match results
-        match_results = [
-            MatchResult(
-                model_a=v["battles"]["model_a_id"],
-                model_b=v["battles"]["model_b_id"],
-                winner=v["winner"]
-            )
-            for v in votes_result.data
-            if v.get("battles")
-        ]
+        # Fold all votes into deduplicated outcome counts
+        overall_outcomes, category_outcomes = await asyncio.to_thread(
+            self._tally_votes
+        )
         
-        if not match_results:
+        if not overall_outcomes:
             return
         
-        # Run Bradley-Terry estimation
-        bt_model = BradleyTerryModel(models=model_ids, match_results=match_results)
-        result = bt_model.estimate()
+        # Win matrices for overall + every category in a single pass
+        groups = [(None, overall_outcomes)] + [
+            (category, outcomes)
+            for category, outcomes in category_outcomes.items()
+            if outcomes
+        ]
+        win_matrices = build_win_matrices(model_ids, [outcomes for _, outcomes in groups])
         
-        # Update overall ratings
-        for model_id in model_ids:
-            wins, losses, ties, win_rate = calculate_win_rate(model_id, match_results)
-            
-            self.db.table("model_ratings").upsert({
-                "model_id": model_id,
-                "elo": int(result.ratings.get(model_id, 1500)),
-                "wins": wins,
-                "losses": losses,
-                "ties": ties,
-                "updated_at": datetime.now().isoformat()
-            }).execute()
+        # Each fit takes well under a millisecond, far less than starting
+        # worker processes would cost, so run them in-process, off the
+        # event loop
+        jobs = [
+            (category, model_ids, W, outcomes)
+            for (category, outcomes), W in zip(groups, win_matrices)
+        ]
+        fits = await asyncio.to_thread(lambda: [_fit_one(*job) for job in jobs])
         
-        # Also recalculate per-category ratings
-        for category in ["admet", "optimization", "notation"]:
-            category_matches = [
-                MatchResult(
-                    model_a=v["battles"]["model_a_id"],
-                    model_b=v["battles"]["model_b_id"],
-                    winner=v["winner"]
-                )
-                for v in votes_result.data
-                if v.get("battles") and v["battles"].get("prompts", {}).get("category") == category
-            ]
-            
-            if category_matches:
-                bt_category = BradleyTerryModel(models=model_ids, match_results=category_matches)
-                category_result = bt_category.estimate()
-                
-                for model_id in model_ids:
-                    wins, losses, ties, _ = calculate_win_rate(model_id, category_matches)
-                    
-                    self.db.table("category_ratings").upsert({
+        # One bulk upsert per table; every row shares one timestamp
+        now_iso = datetime.now(timezone.utc).isoformat()
+        rating_rows = []
+        category_rows = []
+        for category, ratings, win_rates in fits:
+            for model_id in model_ids:
+                wins, losses, ties, _ = win_rates[model_id]
+                if category is None:
+                    rating_rows.append({
+                        "model_id": model_id,
+                        "elo": int(ratings.get(model_id, 1500)),
+                        "wins": wins,
+                        "losses": losses,
+                        "ties": ties,
+                        "updated_at": now_iso
+                    })
+                else:
+                    category_rows.append({
                         "model_id": model_id,
                         "category": category,
-                        "elo": int(category_result.ratings.get(model_id, 1500)),
+                        "elo": int(ratings.get(model_id, 1500)),
                         "wins": wins,
                         "losses": losses,
                         "ties": ties,
-                        "updated_at": datetime.now().isoformat()
-                    }, on_conflict="model_id,category").execute()
-
+                        "updated_at": now_iso
+                    })
+        
+        # The two tables are independent, so write them concurrently
+        upserts = [self.db.table("model_ratings").upsert(rating_rows)]
+        if category_rows:
+            upserts.append(
+                self.db.table("category_ratings")
+                    .upsert(category_rows, on_conflict="model_id,category")
+            )
+        await asyncio.gather(*(asyncio.to_thread(query.execute) for query in upserts))
+        
+        _bump_votes_version()
+    
+    def _iter_votes(self) -> Iterator[dict]:
+        """
+        Yield every vote with its battle info, one page at a time.
+        
+        Pages are ordered by created_at (id breaks ties) so votes cast
+        during the scan land after the current offset instead of shifting
+        rows already read into later pages.
+        """
+        offset = 0
+        while True:
+            result = self.db.table("votes") \
+                .select("winner, battles(model_a_id, model_b_id, prompts(category))") \
+                .order("created_at") \
+                .order("id") \
+                .range(offset, offset + self.VOTES_PAGE_SIZE - 1) \
+                .execute()
+            if not result.data:
+                return
+            yield from result.data
+            # Advance by rows received, in case the server caps page size
+            offset += len(result.data)
+    
+    def _tally_votes(self) -> tuple[list[Outcome], dict[str, list[Outcome]]]:
+        """
+        Stream votes into overall and per-category outcome counts.
+        
+        Only the counters are kept, so memory is bounded by the number of
+        distinct (model_a, model_b, winner) triples rather than by votes.
+        
+        Returns:
+            Tuple of (overall outcomes, category -> outcomes)
+        """
+        overall: Counter = Counter()
+        by_category: dict[str, Counter] = {cat.id: Counter() for cat in self.CATEGORIES}
+        
+        for vote in self._iter_votes():
+            battle = vote.get("battles")
+            if not battle:
+                continue
+            
+            key = (battle["model_a_id"], battle["model_b_id"], vote["winner"])
+            overall[key] += 1
+            
+            category = (battle.get("prompts") or {}).get("category")
+            if category in by_category:
+                by_category[category][key] += 1
+        
+        return (
+            outcomes_from_counts(overall),
+            {category: outcomes_from_counts(counts) for category, counts in by_category.items()}
+        )
@@ -339,3 +339,82 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- The query functions below are also shipped in add_query_functions.sql
+-- for databases created before they were added; keep the two in sync.
+
+-- Function to fetch a battle with its prompt, both models and the latest
+-- vote as a single flat row (used by GET /api/battles/{id})
+CREATE OR REPLACE FUNCTION get_battle_result(p_id UUID)
+RETURNS JSON AS $$
+    SELECT json_build_object(
+        'id', b.id,
+        'prompt_text', p.text,
+        'prompt_category', p.category,
+        'model_a_id', b.model_a_id,
+        'model_a_name', ma.name,
+        'model_a_provider', ma.provider,
+        'model_b_id', b.model_b_id,
+        'model_b_name', mb.name,
+        'model_b_provider', mb.provider,
+        'response_a', b.response_a,
+        'response_b', b.response_b,
+        'winner', COALESCE((
+            SELECT v.winner
+            FROM votes v
+            WHERE v.battle_id = b.id
+            ORDER BY v.created_at DESC
+            LIMIT 1
+        ), 'tie')
+    )
+    FROM battles b
+    JOIN prompts p ON b.prompt_id = p.id
+    JOIN models ma ON b.model_a_id = ma.id
+    JOIN models mb ON b.model_b_id = mb.id
+    WHERE b.id = p_id;
+$$ LANGUAGE sql STABLE;
+
+-- Function to fetch a leaderboard page and the total battle count in a
+-- single round trip (p_category NULL means the overall leaderboard)
+CREATE OR REPLACE FUNCTION get_leaderboard_with_count(
+    p_category TEXT DEFAULT NULL,
+    p_limit INTEGER DEFAULT 20
+) RETURNS JSON AS $$
+DECLARE
+    v_entries JSON;
+BEGIN
+    IF p_category IS NULL THEN
+        SELECT json_agg(l ORDER BY l.elo DESC) INTO v_entries
+        FROM (
+            SELECT model_id, model_name, provider, is_new, elo, wins, losses,
+                   ties, win_rate, confidence, total_matches
+            FROM leaderboard_overall
+            ORDER BY elo DESC
+            LIMIT p_limit
+        ) l;
+    ELSE
+        SELECT json_agg(l ORDER BY l.elo DESC) INTO v_entries
+        FROM (
+            SELECT model_id, model_name, provider, is_new, elo, wins, losses,
+                   ties, win_rate, confidence, total_matches
+            FROM leaderboard_by_category
+            WHERE category = p_category
+            ORDER BY elo DESC
+            LIMIT p_limit
+        ) l;
+    END IF;
+    
+    RETURN json_build_object(
+        'entries', COALESCE(v_entries, '[]'::json),
+        'total_battles', (SELECT COUNT(*) FROM battles)
+    );
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- Function to count battles per prompt category in one grouped query
+CREATE OR REPLACE FUNCTION get_category_battle_counts()
+RETURNS TABLE (category TEXT, total_battles BIGINT) AS $$
+    SELECT p.category, COUNT(*)
+    FROM battles b
+    JOIN prompts p ON b.prompt_id = p.id
+    GROUP BY p.category;
+$$ LANGUAGE sql STABLE;
@@ -0,0 +1,32 @@
+"""
+Tests for unhandled-error handling.
+"""
+
+from fastapi.testclient import TestClient
+
+from app.config import get_settings
+from app.dependencies import get_rating_service
+from app.main import app
+
+
+class _FailingRatingService:
+    async def get_leaderboard(self, **kwargs):
+        raise RuntimeError("db down")
+
+
+def test_unhandled_error_keeps_cors_headers(caplog):
+    origin = get_settings().cors_origins_list[0]
+    app.dependency_overrides[get_rating_service] = lambda: _FailingRatingService()
+    try:
+        with TestClient(app, raise_server_exceptions=False) as client:
+            response = client.get(
+                "/api/leaderboard",
+                headers={"Origin": origin}
+            )
+    finally:
+        app.dependency_overrides.clear()
+    
+    assert response.status_code == 500
+    assert response.json() == {"detail": "db down"}
+    assert response.headers["access-control-allow-origin"] == origin
+    assert "Unhandled error" in caplog.text
@@ -0,0 +1,96 @@
+"""
+Tests for the Bradley-Terry rating fit.
+"""
+
+import random
+
+import numpy as np
+
+from app.services.rating_service import BradleyTerryModel, MatchResult, _bt_iterate
+
+
+def _matches(model_a: str, model_b: str, winner: str, count: int) -> list[MatchResult]:
+    return [MatchResult(model_a=model_a, model_b=model_b, winner=winner)] * count
+
+
+def test_two_model_fit_converges():
+    # Regression: a simultaneous (Jacobi) update flips the ratio every
+    # iteration and ended at 1500/1500 without converging
+    matches = _matches("a", "b", "A", 3) + _matches("a", "b", "B", 1)
+    
+    result = BradleyTerryModel(
+        models=["a", "b"],
+        match_results=matches,
+        virtual_tie_weight=0.0
+    ).estimate()
+    
+    assert result.converged
+    assert result.ratings == {"a": 1595, "b": 1405}
+
+
+def test_three_model_cycle_is_even():
+    matches = (
+        _matches("a", "b", "A", 2)
+        + _matches("b", "c", "A", 2)
+        + _matches("c", "a", "A", 2)
+    )
+    
+    result = BradleyTerryModel(models=["a", "b", "c"], match_results=matches).estimate()
+    
+    assert result.converged
+    assert result.ratings == {"a": 1500, "b": 1500, "c": 1500}
+
+
+def test_three_model_fit_solves_likelihood_equations():
+    # W[i, j] = wins of i over j; every pair has played
+    W = np.array([
+        [0.0, 3.0, 4.0],
+        [1.0, 0.0, 2.0],
+        [1.0, 2.0, 0.0],
+    ])
+    
+    p, iterations, converged = _bt_iterate(W, np.ones(3), 200, 1e-10, 1)
+    
+    assert converged
+    assert iterations < 50
+    assert np.isclose(p.sum(), 3.0)
+    # At the MLE each model's expected wins equal its observed wins
+    games = W + W.T
+    expected_wins = (games * p[:, None] / (p[:, None] + p[None, :])).sum(axis=1)
+    assert np.allclose(expected_wins, W.sum(axis=1))
+
+
+def test_fewer_than_two_models():
+    # A match against an unrated model leaves one model with no comparisons
+    matches = [MatchResult(model_a="a", model_b="b", winner="A")]
+    
+    result = BradleyTerryModel(models=["a"], match_results=matches).estimate()
+    assert result.ratings == {"a": 1500}
+    assert result.converged
+    
+    assert BradleyTerryModel(models=[], match_results=[]).estimate().ratings == {}
+
+
+def test_one_sided_record_is_regularized():
+    # The default prior is one virtual tie per pair: 10-0 scores as
+    # 10.5-0.5 over 11 games rather than an unbounded rating gap
+    matches = _matches("a", "b", "A", 10)
+    
+    result = BradleyTerryModel(models=["a", "b"], match_results=matches).estimate()
+    
+    assert result.converged
+    assert result.ratings == {"a": 1764, "b": 1236}
+
+
+def test_sparse_votes_give_moderate_ratings():
+    rng = random.Random(0)
+    models = [f"m{i}" for i in range(20)]
+    matches = [
+        MatchResult(*rng.sample(models, 2), winner=rng.choice(["A", "B", "tie"]))
+        for _ in range(40)
+    ]
+    
+    result = BradleyTerryModel(models=models, match_results=matches).estimate()
+    
+    assert result.converged
+    assert all(1300 <= elo <= 1700 for elo in result.ratings.values())